@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 from src.data_loader import DataLoader
 from src.role_filter import RoleFilter  
 from src.query_parser import QueryParser
+from src.export import csv_chunks
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +29,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Display names for result table columns
+_DISPLAY_COLUMNS = {
+    'student_name': 'Student Name',
+    'grade': 'Grade',
+    'class': 'Class',
+    'homework_status': 'Homework Status',
+    'quiz_score': 'Quiz Score',
+    'date': 'Date',
+    'region': 'Region'
+}
+
 # Initialize
 if 'current_admin' not in st.session_state:
     st.session_state.current_admin = None
@@ -38,10 +50,31 @@ def init_components():
     data_loader.load_students()
     data_loader.load_admins()
     query_parser = QueryParser()
-    return data_loader, query_parser
+    admin_options = {a['name']: a for a in data_loader.admins}
+    return data_loader, query_parser, admin_options
+
+@st.cache_resource(ttl=3600)
+def get_scoped_df(admin_id):
+    """Role-scoped student frame, computed once per admin"""
+    data_loader, _, _ = init_components()
+    admin = data_loader.get_admin_by_id(admin_id)
+    return RoleFilter.filter_by_admin_scope(data_loader.students_df, admin)
+
+@st.cache_data(ttl=3600)
+def get_quick_stats(admin_id):
+    """Quick stats for an admin's scope, computed in a single pass"""
+    data_loader, _, _ = init_components()
+    scoped_df = get_scoped_df(admin_id)
+    scope_idx = data_loader.students_df.index.get_indexer(scoped_df.index)
+    return {
+        "total": len(scoped_df),
+        "submitted": int(data_loader.submitted_mask[scope_idx].sum()),
+        "pending": int(data_loader.pending_mask[scope_idx].sum()),
+        "avg_score": float(scoped_df['quiz_score'].mean())
+    }
 
 try:
-    data_loader, query_parser = init_components()
+    data_loader, query_parser, admin_options = init_components()
 except Exception as e:
     st.error(f"❌ Error initializing: {str(e)}")
     st.stop()
@@ -51,14 +84,10 @@ with st.sidebar:
     st.title("🎓 Admin Panel")
     st.markdown("---")
     
-    admins = data_loader.admins
-    admin_options = {f"{a['name']}": a['admin_id'] for a in admins}
-    
     selected_admin = st.selectbox("Select Admin", list(admin_options.keys()))
     
     if selected_admin:
-        admin_id = admin_options[selected_admin]
-        st.session_state.current_admin = data_loader.get_admin_by_id(admin_id)
+        st.session_state.current_admin = admin_options[selected_admin]
         admin = st.session_state.current_admin
         st.success(f"✅ Logged in as **{admin['name']}**")
         
@@ -76,26 +105,22 @@ admin = st.session_state.current_admin
 st.title("🔍 Student Query System")
 st.markdown(f"Welcome, **{admin['name']}**")
 
-# Get admin's accessible data
-filtered_by_role = RoleFilter.filter_by_admin_scope(data_loader.students_df, admin)
+# Quick Stats (cached per admin, so keystrokes don't recompute them)
+quick_stats = get_quick_stats(admin['admin_id'])
 
-if len(filtered_by_role) == 0:
+if quick_stats['total'] == 0:
     st.warning("⚠️ No students in your scope")
     st.stop()
 
-# Quick Stats
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("Total Students", len(filtered_by_role))
+    st.metric("Total Students", quick_stats['total'])
 with col2:
-    submitted = len(filtered_by_role[filtered_by_role['homework_status'] == 'submitted'])
-    st.metric("Homework Submitted", submitted)
+    st.metric("Homework Submitted", quick_stats['submitted'])
 with col3:
-    pending = len(filtered_by_role[filtered_by_role['homework_status'] == 'not_submitted'])
-    st.metric("Homework Pending", pending)
+    st.metric("Homework Pending", quick_stats['pending'])
 with col4:
-    avg_score = filtered_by_role['quiz_score'].mean()
-    st.metric("Average Score", f"{avg_score:.1f}")
+    st.metric("Average Score", f"{quick_stats['avg_score']:.1f}")
 
 st.markdown("---")
 
@@ -112,21 +137,24 @@ user_query = st.text_input(
 col1, col2, col3, col4 = st.columns(4)
 with col1:
     if st.button("🏆 Show Topper"):
-        user_query = "Who is the topper student?"
+        user_query = QueryParser.TOPPER_QUERY
 with col2:
     if st.button("📝 Pending Homework"):
-        user_query = "Show students with pending homework"
+        user_query = QueryParser.PENDING_HOMEWORK_QUERY
 with col3:
     if st.button("⭐ High Scorers (>80)"):
-        user_query = "Show students who scored above 80"
+        user_query = QueryParser.HIGH_SCORERS_QUERY
 with col4:
     if st.button("📊 All Students"):
-        user_query = "Show all students"
+        user_query = QueryParser.ALL_STUDENTS_QUERY
 
 # Process Query
 if user_query:
     with st.spinner("🤔 Processing your query..."):
         try:
+            # Get admin's accessible data
+            filtered_by_role = get_scoped_df(admin['admin_id'])
+            
             # Parse query
             available_columns = list(filtered_by_role.columns)
             parsed_query = query_parser.parse_query(user_query, available_columns)
@@ -150,22 +178,8 @@ if user_query:
             
             # Show data table
             elif results['count'] > 0:
-                result_df = results['data'].copy()
-                
-                # Rename columns for display
-                display_columns = {
-                    'student_name': 'Student Name',
-                    'grade': 'Grade',
-                    'class': 'Class',
-                    'homework_status': 'Homework Status',
-                    'quiz_score': 'Quiz Score',
-                    'date': 'Date',
-                    'region': 'Region'
-                }
-                
-                # Only rename columns that exist
-                rename_dict = {k: v for k, v in display_columns.items() if k in result_df.columns}
-                result_df = result_df.rename(columns=rename_dict)
+                # Rename columns for display (missing columns are ignored)
+                result_df = results['data'].rename(columns=_DISPLAY_COLUMNS)
                 
                 # Display table
                 st.dataframe(
@@ -176,7 +190,7 @@ if user_query:
                 )
                 
                 # Export to CSV
-                csv = results['data'].to_csv(index=False)
+                csv = b''.join(csv_chunks(results['data']))
                 st.download_button(
                     label="📥 Export to CSV",
                     data=csv,
@@ -187,13 +201,23 @@ if user_query:
                 
                 # Basic Stats
                 st.markdown("### 📊 Statistics")
+                score_stats = None
+                if 'Quiz Score' in result_df.columns:
+                    scores = result_df['Quiz Score']
+                    stats = scores.agg(['mean', 'max', 'min'])
+                    # agg upcasts to float; show max/min in the column's own type
+                    score_stats = {
+                        'mean': stats['mean'],
+                        'max': scores.dtype.type(stats['max']),
+                        'min': scores.dtype.type(stats['min'])
+                    }
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Average Score", f"{result_df['Quiz Score'].mean():.2f}" if 'Quiz Score' in result_df.columns else "N/A")
+                    st.metric("Average Score", f"{score_stats['mean']:.2f}" if score_stats is not None else "N/A")
                 with col2:
-                    st.metric("Highest Score", f"{result_df['Quiz Score'].max()}" if 'Quiz Score' in result_df.columns else "N/A")
+                    st.metric("Highest Score", f"{score_stats['max']}" if score_stats is not None else "N/A")
                 with col3:
-                    st.metric("Lowest Score", f"{result_df['Quiz Score'].min()}" if 'Quiz Score' in result_df.columns else "N/A")
+                    st.metric("Lowest Score", f"{score_stats['min']}" if score_stats is not None else "N/A")
         
         except Exception as e:
             st.error(f"❌ Error processing query: {str(e)}")
@@ -1,7 +1,41 @@
 import json
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 
+# orjson parses much faster than stdlib json; fall back if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow columnarizes list-of-dict records faster than the DataFrame constructor
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _read_json(path: str):
+    """Read and parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _records_to_frame(records: List[Dict]) -> pd.DataFrame:
+    """Build a DataFrame from a list of dicts, via Arrow when available"""
+    if pa is not None and records:
+        try:
+            # pa.array infers the struct type from every record, not just the first
+            return pa.Table.from_struct_array(pa.array(records)).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass  # Mixed-type or out-of-int64 column; let pandas infer it
+    return pd.DataFrame(records)
+
+
 class DataLoader:
     """Load and manage JSON data for students and admins"""
     
@@ -11,34 +45,61 @@ class DataLoader:
         self.admins_path = admins_path
         self.students_df = None
         self.admins = None
+        self._admins_by_id = {}
+        self.submitted_mask = None
+        self.pending_mask = None
         
     def load_students(self) -> pd.DataFrame:
         """Load students from JSON file into DataFrame"""
         try:
-            with open(self.students_path, 'r', encoding='utf-8') as f:
-                students = json.load(f)
+            students = _read_json(self.students_path)
             
             # Data is a direct list
             if not isinstance(students, list):
                 raise ValueError("students.json should be a JSON array")
             
-            self.students_df = pd.DataFrame(students)
+            self.students_df = _records_to_frame(students)
             
             # Convert date column to datetime
             if 'date' in self.students_df.columns:
                 self.students_df['date'] = pd.to_datetime(self.students_df['date'])
             
+            # Low-cardinality string columns compare on integer codes as categoricals
+            for col in ('class', 'region'):
+                if col in self.students_df.columns:
+                    self.students_df[col] = self.students_df[col].astype('category')
+            
             # Standardize homework_status values
             if 'homework_status' in self.students_df.columns:
                 # Map variations to standard values
                 status_map = {
                     'pending': 'not_submitted',
                     'not submitted': 'not_submitted',
-                    'submitted': 'submitted'
+                    "haven't submitted": 'not_submitted',
+                    'submitted': 'submitted',
+                    'completed': 'submitted',
+                    'done': 'submitted'
                 }
-                self.students_df['homework_status'] = self.students_df['homework_status'].str.lower().map(
-                    lambda x: status_map.get(x, x)
-                )
+                # Normalize the few distinct raw values, not every row
+                raw = self.students_df['homework_status'].astype('category')
+                # Non-string values become missing, as .str.lower() would make them
+                canonical = [
+                    status_map.get(c.lower(), c.lower()) if isinstance(c, str) else None
+                    for c in raw.cat.categories
+                ]
+                
+                # Encode as categorical: code 0 = submitted, code 1 = not_submitted
+                categories = ['submitted', 'not_submitted']
+                categories += sorted(set(canonical) - set(categories) - {None})
+                
+                # Remap raw codes to canonical codes; the trailing -1 keeps missing values missing
+                lookup = np.array([categories.index(c) if c is not None else -1 for c in canonical] + [-1])
+                codes = lookup[raw.cat.codes.to_numpy()]
+                self.students_df['homework_status'] = pd.Categorical.from_codes(codes, categories=categories)
+                
+                # Precompute status masks once so stats don't re-compare strings
+                self.submitted_mask = codes == 0
+                self.pending_mask = codes == 1
             
             print(f"✅ Loaded {len(self.students_df)} student records")
             return self.students_df
@@ -51,14 +112,14 @@ class DataLoader:
     def load_admins(self) -> List[Dict]:
         """Load admins from JSON file"""
         try:
-            with open(self.admins_path, 'r', encoding='utf-8') as f:
-                admins = json.load(f)
+            admins = _read_json(self.admins_path)
             
             # Data is a direct list
             if not isinstance(admins, list):
                 raise ValueError("admins.json should be a JSON array")
             
             self.admins = admins
+            self._admins_by_id = {a.get('admin_id'): a for a in admins}
             print(f"✅ Loaded {len(self.admins)} admin profiles")
             return self.admins
         
@@ -72,10 +133,7 @@ class DataLoader:
         if self.admins is None:
             self.load_admins()
         
-        for admin in self.admins:
-            if admin.get('admin_id') == admin_id:
-                return admin
-        return None
+        return self._admins_by_id.get(admin_id)
     
     def get_student_columns(self) -> List[str]:
         """Get list of available columns in student data"""
@@ -93,7 +151,7 @@ class DataLoader:
             "grades": sorted(self.students_df['grade'].unique().tolist()),
             "classes": sorted(self.students_df['class'].unique().tolist()),
             "regions": sorted(self.students_df['region'].unique().tolist()),
-            "homework_submitted": len(self.students_df[self.students_df['homework_status'] == 'submitted']),
-            "homework_pending": len(self.students_df[self.students_df['homework_status'] == 'not_submitted']),
+            "homework_submitted": int(self.submitted_mask.sum()),
+            "homework_pending": int(self.pending_mask.sum()),
             "avg_quiz_score": round(self.students_df['quiz_score'].mean(), 2)
         }
\ No newline at end of file
@@ -0,0 +1,36 @@
+import io
+from typing import Iterator, Optional
+
+import pandas as pd
+
+
+def _datetime_format(df: pd.DataFrame) -> Optional[str]:
+    """
+    Pick one datetime format for the whole frame
+    to_csv chooses a format per call, so chunks must share the frame-wide choice
+    """
+    has_time = has_fraction = False
+    for col in df.select_dtypes(include=["datetime64"]).columns:
+        values = df[col].dropna()
+        has_time |= bool((values != values.dt.normalize()).any())
+        has_fraction |= bool((values != values.dt.floor("s")).any())
+
+    if has_fraction:
+        return "%Y-%m-%d %H:%M:%S.%f"
+    if has_time:
+        return "%Y-%m-%d %H:%M:%S"
+    # Dates only: every chunk gets pandas' date-only default
+    return None
+
+
+def csv_chunks(df: pd.DataFrame, chunk_size: int = 10_000) -> Iterator[bytes]:
+    """Yield a DataFrame as UTF-8 CSV bytes, a chunk of rows at a time"""
+    date_format = _datetime_format(df)
+
+    buf = io.StringIO()
+    df.iloc[:0].to_csv(buf, index=False)
+    yield buf.getvalue().encode('utf-8')
+    for start in range(0, len(df), chunk_size):
+        buf = io.StringIO()
+        df.iloc[start:start + chunk_size].to_csv(buf, index=False, header=False, date_format=date_format)
+        yield buf.getvalue().encode('utf-8')
@@ -1,7 +1,10 @@
 import os
+import copy
 import json
+import functools
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 # ✅ Updated imports (no more pydantic_v1 warning)
@@ -10,6 +13,12 @@ from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
+# Optional JIT path for large frames; plain numpy is used when numba is missing
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 
 # ------------------------- Pydantic Schemas -------------------------
 class FilterOperator(BaseModel):
@@ -28,10 +37,138 @@ class QueryIntent(BaseModel):
     limit: Optional[int] = Field(default=None, description="Maximum number of results to return")
 
 
+# Comparison operators the parser may emit, mapped to numpy ufuncs
+_OPERATORS = {
+    ">": np.greater, "greater than": np.greater,
+    "<": np.less, "less than": np.less,
+    ">=": np.greater_equal, "greater than or equal": np.greater_equal,
+    "<=": np.less_equal, "less than or equal": np.less_equal,
+    "!=": np.not_equal, "not equal": np.not_equal,
+    "=": np.equal, "equal": np.equal,
+}
+
+
+# Operator codes understood by the numba filter kernel
+_KERNEL_OPS = {
+    np.greater: 1, np.less: 2, np.greater_equal: 3,
+    np.less_equal: 4, np.not_equal: 5, np.equal: 6,
+}
+
+# Below this many rows the numpy path is faster than dispatching to the kernel
+_NUMBA_MIN_ROWS = 10_000
+
+_NAT_I8 = np.iinfo(np.int64).min
+
+
+def _day_window(day: pd.Timestamp):
+    """Half-open [midnight, next midnight) bounds covering one calendar day"""
+    start = day.floor("D")
+    return start, start + pd.Timedelta(days=1)
+
+
+def _date_window(date_filter: Optional[str], now: pd.Timestamp):
+    """Half-open [lo, hi) bounds for a date filter (None = unbounded)"""
+    if date_filter == "today":
+        return _day_window(now)
+    if date_filter == "yesterday":
+        return _day_window(now - timedelta(days=1))
+    if date_filter == "last_week":
+        return now - timedelta(days=7), None
+    if date_filter == "last_month":
+        return now - timedelta(days=30), None
+    if date_filter == "next_week":
+        # Upper bound is inclusive (date <= now + 7 days)
+        return now, now + timedelta(days=7) + pd.Timedelta(1, "ns")
+    return None
+
+
+def _ticks_ceil(ts: pd.Timestamp, unit: str) -> int:
+    """Smallest integer tick in `unit` that is >= ts"""
+    step = int(np.timedelta64(1, unit) // np.timedelta64(1, "ns"))
+    return -(-ts.value // step)
+
+
+def _compare(series: pd.Series, op, value) -> np.ndarray:
+    """Apply a comparison ufunc to a column's raw values"""
+    categorical = isinstance(series.dtype, pd.CategoricalDtype)
+    try:
+        if categorical and op not in (np.equal, np.not_equal):
+            # Unordered categoricals only support ==/!=; compare the few categories
+            # by value and expand through the codes (missing values never match)
+            hits = np.append(op(np.asarray(series.cat.categories, dtype=object), value), False)
+            return hits[series.cat.codes.to_numpy()]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Raw datetime64 values don't parse string operands the way pandas does
+            value = pd.Timestamp(pd.to_datetime(value, errors="coerce")).to_datetime64()
+        return op(series.values, value)
+    except TypeError:
+        # Operand doesn't fit the column (e.g. grade == "8", score > None, or
+        # missing text values); pandas' object comparison treats these as no match
+        return op(series.astype(object) if categorical else series, value).to_numpy()
+
+
+def _sort_key(series: pd.Series) -> pd.Series:
+    """Sort categoricals by their values, not their category order"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(object)
+    return series
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _filter_kernel(n, grade, score, dates, has_grade, grade_eq,
+                       score_op, score_val, has_date, date_lo, date_hi):
+        """Fused grade / quiz_score / date-window predicate over raw columns"""
+        mask = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            keep = True
+            if has_grade:
+                keep = grade[i] == grade_eq
+            if keep and score_op != 0:
+                s = score[i]
+                if score_op == 1:
+                    keep = s > score_val
+                elif score_op == 2:
+                    keep = s < score_val
+                elif score_op == 3:
+                    keep = s >= score_val
+                elif score_op == 4:
+                    keep = s <= score_val
+                elif score_op == 5:
+                    keep = s != score_val
+                else:
+                    keep = s == score_val
+            if keep and has_date:
+                d = dates[i]
+                keep = d != _NAT_I8 and d >= date_lo and d < date_hi
+            mask[i] = keep
+        return mask
+else:
+    _filter_kernel = None
+
+
 # ------------------------- Query Parser -------------------------
 class QueryParser:
     """Parse natural language queries using Groq API with LangChain"""
 
+    # Quick-action queries used by the app's buttons
+    TOPPER_QUERY = "Who is the topper student?"
+    PENDING_HOMEWORK_QUERY = "Show students with pending homework"
+    HIGH_SCORERS_QUERY = "Show students who scored above 80"
+    ALL_STUDENTS_QUERY = "Show all students"
+
+    # Known parses for the quick-action queries; these skip the LLM
+    _PRESETS = {
+        TOPPER_QUERY: {"intent": "list", "filters": {}, "sort_by": "quiz_score", "limit": 1},
+        PENDING_HOMEWORK_QUERY: {"intent": "list", "filters": {"homework_status": "not_submitted"}},
+        HIGH_SCORERS_QUERY: {"intent": "list", "filters": {"quiz_score": {"operator": ">", "value": 80}}},
+        ALL_STUDENTS_QUERY: {"intent": "list", "filters": {}},
+    }
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
@@ -46,6 +183,8 @@ class QueryParser:
         )
 
         self.parser = JsonOutputParser(pydantic_object=QueryIntent)
+        # Static prompt text derived from the schema; build it once
+        self._format_instructions = self.parser.get_format_instructions()
 
         self.prompt_template = ChatPromptTemplate.from_messages([
             ("system", """You are a query parser for a student management system.
@@ -86,15 +225,26 @@ Examples:
 
         self.chain = self.prompt_template | self.llm | self.parser
 
+        # temperature=0 makes parsing deterministic, so identical queries can be memoized
+        self._cached_invoke = functools.lru_cache(maxsize=512)(self._invoke_chain)
+
     # ------------------------- Parse Query -------------------------
+    def _invoke_chain(self, user_query: str, columns_key: tuple) -> str:
+        """Run the LLM chain; returns JSON text so the cached value stays immutable"""
+        result = self.chain.invoke({
+            "query": user_query,
+            "columns": ", ".join(columns_key),
+            "format_instructions": self._format_instructions
+        })
+        return json.dumps(result)
+
     def parse_query(self, user_query: str, available_columns: List[str]) -> Dict:
+        if user_query in self._PRESETS:
+            return {**self._get_default_query(), **copy.deepcopy(self._PRESETS[user_query])}
+
         try:
-            format_instructions = self.parser.get_format_instructions()
-            result = self.chain.invoke({
-                "query": user_query,
-                "columns": ", ".join(available_columns),
-                "format_instructions": format_instructions
-            })
+            columns_key = tuple(sorted(available_columns))
+            result = json.loads(self._cached_invoke(user_query, columns_key))
 
             result.setdefault("intent", "list")
             result.setdefault("filters", {})
@@ -119,80 +269,117 @@ Examples:
         if df is None or df.empty:
             return df
 
-        filtered_df = df.copy()
+        today = pd.Timestamp.now()
+        mask = None
+        if _filter_kernel is not None and len(df) > _NUMBA_MIN_ROWS:
+            mask = self._kernel_mask(df, parsed_query, today)
+        if mask is None:
+            mask = self._numpy_mask(df, parsed_query, today)
+
+        filtered_df = df.iloc[mask]
+
+        # ✅ Sorting and limit (top-k via nlargest instead of a full sort)
+        sort_by = parsed_query.get("sort_by")
+        limit = parsed_query.get("limit")
+        has_sort = sort_by in filtered_df.columns
+        has_limit = isinstance(limit, int)
+
+        if has_sort and has_limit and pd.api.types.is_numeric_dtype(filtered_df[sort_by]):
+            return filtered_df.nlargest(limit, sort_by)
+        if has_sort:
+            filtered_df = filtered_df.sort_values(by=sort_by, ascending=False, key=_sort_key)
+        if has_limit:
+            filtered_df = filtered_df.head(limit)
 
-        # ✅ Normalize homework_status variations
-        if "homework_status" in filtered_df.columns:
-            filtered_df["homework_status"] = filtered_df["homework_status"].str.lower().replace({
-                "pending": "not_submitted",
-                "not submitted": "not_submitted",
-                "haven't submitted": "not_submitted",
-                "submitted": "submitted",
-                "completed": "submitted",
-                "done": "submitted"
-            })
+        return filtered_df
 
-        # ✅ Convert 'date' column to datetime if it's string
-        if "date" in filtered_df.columns:
-            filtered_df["date"] = pd.to_datetime(filtered_df["date"], errors="coerce")
+    def _numpy_mask(self, df: pd.DataFrame, parsed_query: Dict, today: pd.Timestamp) -> np.ndarray:
+        # Loader already normalized homework_status and parsed dates; AND every
+        # predicate into one mask so the frame is indexed once
+        mask = np.ones(len(df), dtype=bool)
 
         # Apply filters
         for column, value in parsed_query.get("filters", {}).items():
-            if column not in filtered_df.columns:
+            if column not in df.columns:
                 print(f"⚠️ Column '{column}' not found, skipping filter")
                 continue
 
             if isinstance(value, dict) and "operator" in value:
-                op, val = value["operator"], value["value"]
-                if op in [">", "greater than"]:
-                    filtered_df = filtered_df[filtered_df[column] > val]
-                elif op in ["<", "less than"]:
-                    filtered_df = filtered_df[filtered_df[column] < val]
-                elif op in [">=", "greater than or equal"]:
-                    filtered_df = filtered_df[filtered_df[column] >= val]
-                elif op in ["<=", "less than or equal"]:
-                    filtered_df = filtered_df[filtered_df[column] <= val]
-                elif op in ["!=", "not equal"]:
-                    filtered_df = filtered_df[filtered_df[column] != val]
-                elif op in ["=", "equal"]:
-                    filtered_df = filtered_df[filtered_df[column] == val]
+                op = _OPERATORS.get(value["operator"])
+                if op is not None:
+                    mask &= _compare(df[column], op, value["value"])
             else:
-                filtered_df = filtered_df[filtered_df[column] == value]
+                mask &= _compare(df[column], np.equal, value)
 
-        # ✅ Date filters
-        today = pd.Timestamp.now()
+        # ✅ Date filters (raw datetime64 values, extracted once)
         date_filter = parsed_query.get("date_filter")
-        if date_filter and "date" in filtered_df.columns:
-            if date_filter == "today":
-                filtered_df = filtered_df[filtered_df["date"].dt.date == today.date()]
-            elif date_filter == "yesterday":
-                yesterday = today - timedelta(days=1)
-                filtered_df = filtered_df[filtered_df["date"].dt.date == yesterday.date()]
-            elif date_filter == "last_week":
-                last_week = today - timedelta(days=7)
-                filtered_df = filtered_df[filtered_df["date"] >= last_week]
-            elif date_filter == "last_month":
-                last_month = today - timedelta(days=30)
-                filtered_df = filtered_df[filtered_df["date"] >= last_month]
-            elif date_filter == "next_week":
-                next_week = today + timedelta(days=7)
-                filtered_df = filtered_df[(filtered_df["date"] >= today) & (filtered_df["date"] <= next_week)]
-
-        # ✅ Specific date
-        if parsed_query.get("specific_date") and "date" in filtered_df.columns:
-            target = pd.to_datetime(parsed_query["specific_date"], errors="coerce")
-            filtered_df = filtered_df[filtered_df["date"].dt.date == target.date()]
-
-        # ✅ Sorting and limit
-        sort_by = parsed_query.get("sort_by")
-        if sort_by in filtered_df.columns:
-            filtered_df = filtered_df.sort_values(by=sort_by, ascending=False)
-
-        limit = parsed_query.get("limit")
-        if isinstance(limit, int):
-            filtered_df = filtered_df.head(limit)
-
-        return filtered_df
+        specific_date = parsed_query.get("specific_date")
+        if (date_filter or specific_date) and "date" in df.columns:
+            dates = df["date"].values
+
+            windows = [_date_window(date_filter, today)]
+            # ✅ Specific date (unparseable dates become NaT and match nothing)
+            if specific_date:
+                target = pd.to_datetime(specific_date, errors="coerce")
+                windows.append(_day_window(target))
+
+            for window in windows:
+                if window is None:
+                    continue
+                lo, hi = window
+                if lo is not None:
+                    mask &= dates >= lo.to_datetime64()
+                if hi is not None:
+                    mask &= dates < hi.to_datetime64()
+
+        return mask
+
+    def _kernel_mask(self, df: pd.DataFrame, parsed_query: Dict, today: pd.Timestamp) -> Optional[np.ndarray]:
+        """Numba mask for grade / quiz_score / date-filter queries; None if the query doesn't fit"""
+        filters = parsed_query.get("filters", {})
+        if not set(filters) <= {"grade", "quiz_score"} or parsed_query.get("specific_date"):
+            return None
+        if not all(col in df.columns and pd.api.types.is_numeric_dtype(df[col]) for col in filters):
+            return None
+
+        window = _date_window(parsed_query.get("date_filter"), today)
+
+        unused = np.empty(0, dtype=np.float64)
+        grade, has_grade, grade_eq = unused, False, 0.0
+        score, score_op, score_val = unused, 0, 0.0
+        dates, has_date, date_lo, date_hi = np.empty(0, dtype=np.int64), False, 0, 0
+
+        if "grade" in filters:
+            if not _is_number(filters["grade"]):
+                return None
+            grade, has_grade, grade_eq = df["grade"].to_numpy(), True, float(filters["grade"])
+
+        if "quiz_score" in filters:
+            value = filters["quiz_score"]
+            if isinstance(value, dict) and "operator" in value:
+                op = _OPERATORS.get(value["operator"])
+                if op is not None:
+                    if not _is_number(value.get("value")):
+                        return None
+                    score_op, score_val = _KERNEL_OPS[op], float(value["value"])
+            elif _is_number(value):
+                score_op, score_val = _KERNEL_OPS[np.equal], float(value)
+            else:
+                return None
+            score = df["quiz_score"].to_numpy()
+
+        if window is not None and "date" in df.columns:
+            values = df["date"].values
+            if not np.issubdtype(values.dtype, np.datetime64):
+                return None
+            unit = np.datetime_data(values.dtype)[0]
+            lo, hi = window
+            dates, has_date = values.view(np.int64), True
+            date_lo = _ticks_ceil(lo, unit) if lo is not None else _NAT_I8 + 1
+            date_hi = _ticks_ceil(hi, unit) if hi is not None else np.iinfo(np.int64).max
+
+        return _filter_kernel(len(df), grade, score, dates, has_grade, grade_eq,
+                              score_op, score_val, has_date, date_lo, date_hi)
 
     # ------------------------- Execute Query -------------------------
     def execute_query(self, df: pd.DataFrame, parsed_query: Dict) -> Dict:
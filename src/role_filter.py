@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 
@@ -13,22 +14,23 @@ class RoleFilter:
         if df is None or len(df) == 0:
             return df
             
-        filtered_df = df.copy()
+        # Build one combined mask and index once (no intermediate frames)
+        mask = np.ones(len(df), dtype=bool)
         
         # Filter by grade if admin has assigned grade
         if 'assigned_grade' in admin and admin['assigned_grade'] is not None:
-            filtered_df = filtered_df[filtered_df['grade'] == admin['assigned_grade']]
+            mask &= df['grade'].values == admin['assigned_grade']
         
         # Filter by class if admin has assigned class
         if 'assigned_class' in admin and admin['assigned_class'] is not None:
-            filtered_df = filtered_df[filtered_df['class'] == admin['assigned_class']]
+            mask &= df['class'].values == admin['assigned_class']
         
         # Filter by region if admin has assigned region
         if 'region' in admin and admin['region'] is not None:
-            if 'region' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['region'] == admin['region']]
+            if 'region' in df.columns:
+                mask &= df['region'].values == admin['region']
         
-        return filtered_df
+        return df.iloc[mask]
     
     @staticmethod
     def get_admin_scope_description(admin: Dict) -> str:
@@ -78,10 +80,12 @@ class RoleFilter:
                 "avg_score": 0
             }
         
+        status_counts = filtered['homework_status'].value_counts()
+        
         return {
             "total_students": len(filtered),
-            "homework_submitted": len(filtered[filtered['homework_status'] == 'submitted']),
-            "homework_pending": len(filtered[filtered['homework_status'] == 'not_submitted']),
+            "homework_submitted": int(status_counts.get('submitted', 0)),
+            "homework_pending": int(status_counts.get('not_submitted', 0)),
             "avg_score": round(filtered['quiz_score'].mean(), 2),
             "highest_score": filtered['quiz_score'].max(),
             "lowest_score": filtered['quiz_score'].min()
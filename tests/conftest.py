@@ -0,0 +1,7 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# test_queries.py is a standalone setup script (it exits without an API key)
+collect_ignore = ["test_queries.py"]
@@ -0,0 +1,66 @@
+"""
+DataLoader normalization of student records
+Usage: python -m pytest tests
+"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.data_loader import DataLoader, _records_to_frame
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+def _load(tmp_path, statuses):
+    records = [
+        {"student_name": f"Student {i}", "grade": 8, "class": "A", "region": "North",
+         "homework_status": status, "quiz_score": 80, "date": "2024-11-10"}
+        for i, status in enumerate(statuses)
+    ]
+    path = tmp_path / "students.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    loader = DataLoader(students_path=str(path))
+    return loader, loader.load_students()
+
+
+def test_homework_status_variants_are_normalized(tmp_path):
+    loader, df = _load(tmp_path, ["Submitted", "pending", "Not Submitted", "done", None, "late"])
+    assert df["homework_status"].tolist()[:4] == ["submitted", "not_submitted", "not_submitted", "submitted"]
+    assert pd.isna(df["homework_status"].iloc[4])
+    assert df["homework_status"].iloc[5] == "late"
+    assert loader.submitted_mask.tolist() == [True, False, False, True, False, False]
+    assert loader.pending_mask.tolist() == [False, True, True, False, False, False]
+
+
+def test_non_string_homework_status_becomes_missing(tmp_path):
+    loader, df = _load(tmp_path, ["submitted", 1, "pending", True])
+    assert df["homework_status"].iloc[0] == "submitted"
+    assert df["homework_status"].iloc[2] == "not_submitted"
+    assert df["homework_status"].iloc[[1, 3]].isna().all()
+    assert loader.submitted_mask.tolist() == [True, False, False, False]
+    assert loader.pending_mask.tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize("records", [
+    # Keys missing from some records, including the first
+    [{"grade": 8, "class": "A"}, {"student_name": "Diya", "grade": 9}],
+    # Mixed types in one column
+    [{"grade": 8}, {"grade": "9"}],
+    # Missing values in numeric and text columns
+    [{"quiz_score": None, "region": None}, {"quiz_score": 72, "region": "North"}],
+    # Ints and floats in one column
+    [{"quiz_score": 80}, {"quiz_score": 72.5}],
+    # Integer outside int64
+    [{"student_id": 2 ** 64}, {"student_id": 1}],
+])
+def test_records_to_frame_matches_dataframe_constructor(records):
+    pd.testing.assert_frame_equal(_records_to_frame(records), pd.DataFrame(records))
+
+
+def test_bundled_students_match_dataframe_constructor():
+    with open(os.path.join(DATA_DIR, "students.json"), encoding="utf-8") as f:
+        records = json.load(f)
+    pd.testing.assert_frame_equal(_records_to_frame(records), pd.DataFrame(records))
@@ -0,0 +1,41 @@
+"""
+CSV export chunking
+Usage: python -m pytest tests
+"""
+
+import pandas as pd
+import pytest
+
+from src.export import csv_chunks
+
+
+def _frame(dates):
+    return pd.DataFrame({
+        "student_name": [f"Student {i}" for i in range(len(dates))],
+        "quiz_score": range(len(dates)),
+        "date": pd.Series([pd.Timestamp(d) if d else pd.NaT for d in dates], dtype="datetime64[ns]"),
+    })
+
+
+@pytest.mark.parametrize("dates", [
+    # Dates only
+    ["2024-11-10", "2024-11-09", "2024-11-08", "2024-11-07"],
+    # First chunk midnight-only, second chunk has times
+    ["2024-11-10", "2024-11-09", "2024-11-08 13:30:00", "2024-11-07 08:00:05"],
+    # Missing dates alongside times
+    ["2024-11-10", None, "2024-11-08 13:30:00", None],
+])
+def test_chunks_match_whole_frame_csv(dates):
+    df = _frame(dates)
+    assert b"".join(csv_chunks(df, chunk_size=2)) == df.to_csv(index=False).encode("utf-8")
+
+
+def test_chunks_share_one_datetime_format():
+    df = _frame(["2024-11-10", "2024-11-09", "2024-11-08 13:30:00"])
+    lines = b"".join(csv_chunks(df, chunk_size=1)).decode("utf-8").splitlines()
+    assert lines[1].endswith("2024-11-10 00:00:00")
+
+
+def test_empty_frame_yields_header_only():
+    df = _frame([])
+    assert b"".join(csv_chunks(df)) == df.to_csv(index=False).encode("utf-8")
@@ -0,0 +1,201 @@
+"""
+Filter / sort behaviour of QueryParser.apply_filters against the bundled data
+Usage: python -m pytest tests
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import query_parser
+from src.data_loader import DataLoader
+from src.query_parser import QueryParser
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+@pytest.fixture(scope="module")
+def students_df():
+    loader = DataLoader(students_path=os.path.join(DATA_DIR, "students.json"))
+    return loader.load_students()
+
+
+@pytest.fixture(scope="module")
+def parser():
+    # Filtering never touches the LLM client, so skip __init__ (no API key needed)
+    return QueryParser.__new__(QueryParser)
+
+
+def test_sort_by_homework_status_uses_string_order(parser, students_df):
+    result = parser.apply_filters(students_df, {"filters": {}, "sort_by": "homework_status"})
+    statuses = result["homework_status"].astype(str).tolist()
+    assert statuses == sorted(statuses, reverse=True)
+    assert statuses[0] == "submitted"
+
+
+def test_sort_by_homework_status_with_limit(parser, students_df):
+    result = parser.apply_filters(students_df, {"filters": {}, "sort_by": "homework_status", "limit": 3})
+    assert result["homework_status"].astype(str).tolist() == ["submitted"] * 3
+
+
+@pytest.mark.parametrize("operator, expected", [(">", 9), (">=", 15), ("<", 0), ("<=", 6), ("!=", 9), ("=", 6)])
+def test_ordering_operators_on_categorical_column(parser, students_df, operator, expected):
+    # Counts match the baseline object-dtype comparison on the bundled data
+    query = {"filters": {"class": {"operator": operator, "value": "A"}}}
+    result = parser.apply_filters(students_df, query)
+    assert len(result) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-11-10", 5),
+    ({"operator": ">=", "value": "2024-11-09"}, 7),
+    ({"operator": "<", "value": "2024-11-09"}, 8),
+    ({"operator": "!=", "value": "2024-11-10"}, 10),
+])
+def test_date_column_in_filters_parses_string_operand(parser, students_df, value, expected):
+    result = parser.apply_filters(students_df, {"filters": {"date": value}})
+    assert len(result) == expected
+
+
+@pytest.mark.parametrize("filters", [
+    {"grade": "8"},
+    {"quiz_score": {"operator": ">", "value": None}},
+    {"class": {"operator": ">", "value": None}},
+])
+def test_mismatched_operand_type_matches_nothing(parser, students_df, filters):
+    assert len(parser.apply_filters(students_df, {"filters": filters})) == 0
+
+
+def test_ordering_filter_on_object_text_column_with_missing_value(parser, students_df):
+    # pandas 2.x keeps text columns as object dtype, where None can't be ordered against str
+    df = students_df.copy()
+    df["student_name"] = df["student_name"].astype(object)
+    df.loc[0, "student_name"] = None
+    result = parser.apply_filters(df, {"filters": {"student_name": {"operator": ">", "value": "M"}}})
+    expected = [name for name in df["student_name"] if name is not None and name > "M"]
+    assert sorted(result["student_name"]) == sorted(expected)
+
+
+# ------------------------- Numba kernel parity -------------------------
+@pytest.fixture(scope="module")
+def large_df():
+    rng = np.random.default_rng(0)
+    n = query_parser._NUMBA_MIN_ROWS * 2
+    scores = rng.integers(40, 101, n).astype(float)
+    scores[rng.random(n) < 0.05] = np.nan
+    dates = pd.Series(
+        pd.Timestamp.now().normalize()
+        + pd.to_timedelta(rng.integers(-40 * 24, 10 * 24, n), unit="h")
+    )
+    dates[rng.random(n) < 0.05] = pd.NaT
+    return pd.DataFrame({
+        "student_name": [f"Student {i}" for i in range(n)],
+        "grade": rng.integers(7, 11, n),
+        "class": pd.Categorical(rng.choice(list("ABC"), n)),
+        "quiz_score": scores,
+        "date": dates,
+    })
+
+
+KERNEL_QUERIES = (
+    [{"filters": {"grade": 8}}, {"filters": {"grade": 9.0}}]
+    + [{"filters": {"quiz_score": {"operator": op, "value": 80}}} for op in query_parser._OPERATORS]
+    + [{"filters": {"quiz_score": 90}}, {"filters": {"quiz_score": {"operator": "bogus", "value": 80}}}]
+    + [{"filters": {}, "date_filter": f} for f in ("today", "yesterday", "last_week", "last_month", "next_week")]
+    + [
+        {"filters": {"grade": 8, "quiz_score": {"operator": ">=", "value": 75}}, "date_filter": "last_month"},
+        {"filters": {"grade": 10, "quiz_score": {"operator": "!=", "value": 60}}, "date_filter": "today"},
+        {"filters": {"quiz_score": {"operator": "<", "value": 50}}, "date_filter": "next_week"},
+    ]
+)
+
+
+@pytest.mark.skipif(query_parser._filter_kernel is None, reason="numba not installed")
+@pytest.mark.parametrize("query", KERNEL_QUERIES)
+def test_kernel_mask_matches_numpy_mask(parser, large_df, query):
+    now = pd.Timestamp.now()
+    kernel_mask = parser._kernel_mask(large_df, query, now)
+    assert kernel_mask is not None
+    np.testing.assert_array_equal(kernel_mask, parser._numpy_mask(large_df, query, now))
+
+
+@pytest.mark.parametrize("query", [
+    {"filters": {"class": "A"}},
+    {"filters": {"grade": "8"}},
+    {"filters": {}, "specific_date": "2024-11-10"},
+])
+def test_kernel_declines_unsupported_queries(parser, large_df, query):
+    assert parser._kernel_mask(large_df, query, pd.Timestamp.now()) is None
+
+
+# ------------------------- Calendar-day windows -------------------------
+@pytest.fixture(scope="module")
+def day_edges_df():
+    day = pd.Timestamp("2024-11-10")
+    dates = []
+    for offset in (-1, 0, 1):
+        start = day + pd.Timedelta(days=offset)
+        dates += [start, start + pd.Timedelta(hours=23, minutes=59, seconds=59, milliseconds=999)]
+    dates.append(pd.NaT)
+    return pd.DataFrame({
+        "grade": 8,
+        "quiz_score": 80.0,
+        "date": pd.Series(dates, dtype="datetime64[ns]"),
+    })
+
+
+@pytest.mark.parametrize("query, target", [
+    ({"date_filter": "today"}, "2024-11-10"),
+    ({"date_filter": "yesterday"}, "2024-11-09"),
+    ({"specific_date": "2024-11-11"}, "2024-11-11"),
+])
+def test_day_window_matches_calendar_date(parser, day_edges_df, query, target):
+    now = pd.Timestamp("2024-11-10 15:30:00")
+    expected = (day_edges_df["date"].dt.date == pd.Timestamp(target).date()).to_numpy()
+    query = {"filters": {}, **query}
+
+    mask = parser._numpy_mask(day_edges_df, query, now)
+    np.testing.assert_array_equal(mask, expected)
+    assert mask.sum() == 2
+
+    if query_parser._filter_kernel is not None and "date_filter" in query:
+        np.testing.assert_array_equal(parser._kernel_mask(day_edges_df, query, now), expected)
+
+
+# ------------------------- Quick-action presets -------------------------
+class _NoLLM:
+    """Stands in for the chain / LLM cache and records any call"""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        raise AssertionError("preset query reached the LLM")
+
+    def invoke(self, *args, **kwargs):
+        return self(*args, **kwargs)
+
+
+@pytest.mark.parametrize("query", [
+    QueryParser.TOPPER_QUERY,
+    QueryParser.PENDING_HOMEWORK_QUERY,
+    QueryParser.HIGH_SCORERS_QUERY,
+    QueryParser.ALL_STUDENTS_QUERY,
+])
+def test_preset_queries_skip_the_llm(students_df, query):
+    parser = QueryParser.__new__(QueryParser)
+    parser.chain = parser._cached_invoke = no_llm = _NoLLM()
+
+    result = parser.parse_query(query, list(students_df.columns))
+
+    assert no_llm.calls == 0
+    assert result == {**parser._get_default_query(), **QueryParser._PRESETS[query]}
+
+
+def test_preset_results_are_independent_copies(students_df):
+    parser = QueryParser.__new__(QueryParser)
+    result = parser.parse_query(QueryParser.PENDING_HOMEWORK_QUERY, list(students_df.columns))
+    result["filters"]["grade"] = 8
+    assert "grade" not in QueryParser._PRESETS[QueryParser.PENDING_HOMEWORK_QUERY]["filters"]
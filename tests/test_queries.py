@@ -78,13 +78,24 @@ if missing:
 # Test 4: Data files
 print_test("4", "Checking data files...")
 
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def read_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 if os.path.exists("data/students.json"):
     print_success("data/students.json found")
-    import json
     try:
-        with open("data/students.json", 'r') as f:
-            students = json.load(f)
-            print(f"      → {len(students)} student records")
+        students = read_json("data/students.json")
+        print(f"      → {len(students)} student records")
     except Exception as e:
         print_error(f"Error reading students.json: {e}")
 else:
@@ -94,9 +105,8 @@ else:
 if os.path.exists("data/admins.json"):
     print_success("data/admins.json found")
     try:
-        with open("data/admins.json", 'r') as f:
-            admins = json.load(f)
-            print(f"      → {len(admins)} admin profiles")
+        admins = read_json("data/admins.json")
+        print(f"      → {len(admins)} admin profiles")
     except Exception as e:
         print_error(f"Error reading admins.json: {e}")
 else:
@@ -0,0 +1,51 @@
+"""
+Role-based scope filtering against the bundled admins
+Usage: python -m pytest tests
+"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.data_loader import DataLoader
+from src.role_filter import RoleFilter
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+with open(os.path.join(DATA_DIR, "admins.json"), encoding="utf-8") as f:
+    ADMINS = json.load(f)
+
+
+@pytest.fixture(scope="module")
+def students_df():
+    loader = DataLoader(students_path=os.path.join(DATA_DIR, "students.json"))
+    return loader.load_students()
+
+
+def _chained_scope_filter(df, admin):
+    """Reference: one boolean index per scope key, as the filter originally did"""
+    filtered = df.copy()
+    if admin.get('assigned_grade') is not None:
+        filtered = filtered[filtered['grade'] == admin['assigned_grade']]
+    if admin.get('assigned_class') is not None:
+        filtered = filtered[filtered['class'] == admin['assigned_class']]
+    if admin.get('region') is not None and 'region' in filtered.columns:
+        filtered = filtered[filtered['region'] == admin['region']]
+    return filtered
+
+
+@pytest.mark.parametrize("admin", ADMINS + [
+    {"admin_id": "X001", "name": "No Scope"},
+    {"admin_id": "X002", "name": "Null Scope", "assigned_grade": None, "assigned_class": None, "region": None},
+    {"admin_id": "X003", "name": "Grade Only", "assigned_grade": 8},
+], ids=lambda admin: admin["admin_id"])
+def test_scope_filter_matches_chained_filter(students_df, admin):
+    result = RoleFilter.filter_by_admin_scope(students_df, admin)
+    pd.testing.assert_frame_equal(result, _chained_scope_filter(students_df, admin))
+
+
+def test_admin_without_scope_sees_everyone(students_df):
+    result = RoleFilter.filter_by_admin_scope(students_df, {"admin_id": "X001", "name": "No Scope"})
+    assert len(result) == len(students_df)